@@ -1,32 +1,13 @@
-import pandas as pd
-import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from common.datagen import generate
+
 
 def generate_train_test():
-    np.random.seed(42)
-    n_train = 100
-    n_test = 20
-    
-    cities = ['Tokyo', 'Osaka', 'Nagoya', 'Fukuoka']
-    
-    # Train Data
-    train = pd.DataFrame({
-        'id': range(1, n_train + 1),
-        'age': np.random.randint(20, 60, size=n_train),
-        'income': np.random.randint(300, 1000, size=n_train) * 10000,
-        'city': np.random.choice(cities, size=n_train)
-    })
-    
-    # Test Data (with potentially unseen categories if not handled, but here we keep simple)
-    test = pd.DataFrame({
-        'id': range(n_train + 1, n_train + n_test + 1),
-        'age': np.random.randint(20, 60, size=n_test),
-        'income': np.random.randint(300, 1000, size=n_test) * 10000,
-        'city': np.random.choice(cities, size=n_test)
-    })
-    
-    train.to_csv('train_data.csv', index=False)
-    test.to_csv('test_data.csv', index=False)
-    print("Generated train_data.csv and test_data.csv")
+    generate('train_test', 100, 42, '.')
 
 if __name__ == "__main__":
     generate_train_test()
@@ -1,21 +1,28 @@
-import pandas as pd
 import numpy as np
+import polars as pl
+import shutil
 import subprocess
-import os
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import accuracy_score
 
+# Resolve the mlprep binary once; None means fall back to cargo
+_MLPREP = shutil.which('mlprep')
+
 def generate_data():
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     n_rows = 200
-    df = pd.DataFrame({
-        'feature1': np.random.normal(0, 1, n_rows),
-        'feature2': np.random.normal(5, 2, n_rows),
-        'feature3': np.random.choice(['A', 'B'], n_rows), # Ignored in features section for now
-        'target': np.random.randint(0, 2, n_rows)
+    # One normal draw for both features, one integer draw for feature3 + target
+    z = rng.standard_normal((n_rows, 2))
+    ints = rng.integers(0, 2, (n_rows, 2))
+    df = pl.DataFrame({
+        'feature1': z[:, 0],
+        'feature2': 5 + 2 * z[:, 1],
+        # Ignored in features section for now
+        'feature3': np.where(ints[:, 0] == 0, 'A', 'B'),
+        'target': ints[:, 1]
     })
-    df.to_csv('raw_data.csv', index=False)
-    print("Generated raw_data.csv")
+    df.write_parquet('raw_data.parquet', compression='zstd')
+    print("Generated raw_data.parquet")
 
 def run_mlprep():
     print("Running mlprep pipeline...")
@@ -23,21 +30,28 @@ def run_mlprep():
     # Using 'mlprep' assuming it's in the environment. 
     # If developing, one might use 'cargo run --release -- run ...'
     
-    # Check if 'mlprep' command exists, else try cargo
-    cmd = ["mlprep", "run", "pipeline.yaml"]
-    try:
-        subprocess.run(cmd, check=True)
-    except FileNotFoundError:
+    # Use the resolved 'mlprep' command if it exists, else try cargo
+    if _MLPREP:
+        cmd = [_MLPREP, "run", "pipeline.yaml"]
+    else:
         print("'mlprep' command not found, trying 'cargo run --release ...'")
-        subprocess.run(["cargo", "run", "--release", "--bin", "mlprep", "--", "run", "pipeline.yaml"], check=True)
+        cmd = [
+            "cargo", "run", "--release", "--bin", "mlprep",
+            "--", "run", "pipeline.yaml",
+        ]
+    subprocess.run(cmd, check=True, stdin=subprocess.DEVNULL)
 
 def train_model():
     print("Loading processed data...")
-    # Read parquet output from mlprep
-    df = pd.read_parquet('processed_train.parquet')
+    # Scan parquet output from mlprep, projecting only the columns we train on
+    lf = pl.scan_parquet('processed_train.parquet').select(
+        ['feature1', 'feature2', 'target']
+    )
+    df = lf.collect(engine='streaming')
     
-    X = df[['feature1', 'feature2']]
-    y = df['target']
+    # Hand sklearn a C-contiguous float64 matrix so fit() does not copy it again
+    X = df.select(pl.col('feature1', 'feature2').cast(pl.Float64)).to_numpy(order='c')
+    y = df['target'].cast(pl.Int64).to_numpy()
     
     print("Training Logistic Regression...")
     model = LogisticRegression()
@@ -1,12 +1,17 @@
 import mlflow
+import shutil
 import subprocess
 import os
-import pandas as pd
 import numpy as np
+import polars as pl
+
+# Resolve the mlprep binary once; None means fall back to cargo
+_MLPREP = shutil.which('mlprep')
 
 def generate_data():
-    df = pd.DataFrame(np.random.rand(10, 2), columns=['col1', 'col2'])
-    df.to_csv('raw_data.csv', index=False)
+    rng = np.random.default_rng(42)
+    df = pl.DataFrame({'col1': rng.random(10), 'col2': rng.random(10)})
+    df.write_csv('raw_data.csv')
 
 def run_experiment():
     mlflow.set_experiment("mlprep_experiment")
@@ -19,17 +24,19 @@ def run_experiment():
         
         # Run mlprep
         print("Running mlprep...")
-        cmd = ["mlprep", "run", "pipeline.yaml"]
+        if _MLPREP:
+            cmd = [_MLPREP, "run", "pipeline.yaml"]
+        else:
+            # Fallback for dev environment
+            cmd = [
+                "cargo", "run", "--release", "--bin", "mlprep",
+                "--", "run", "pipeline.yaml",
+            ]
         try:
-            subprocess.run(cmd, check=True)
+            subprocess.run(cmd, check=True, stdin=subprocess.DEVNULL)
             run_status = "SUCCESS"
         except (subprocess.CalledProcessError, FileNotFoundError):
-            # Fallback for dev environment
-            try:
-                subprocess.run(["cargo", "run", "--release", "--bin", "mlprep", "--", "run", "pipeline.yaml"], check=True)
-                run_status = "SUCCESS"
-            except subprocess.CalledProcessError:
-                run_status = "FAILED"
+            run_status = "FAILED"
         
         mlflow.log_param("status", run_status)
         
@@ -1,6 +1,15 @@
 from datetime import datetime, timedelta
 from airflow import DAG
-from airflow.operators.bash import BashOperator
+from airflow.decorators import task
+from airflow.sensors.filesystem import FileSensor
+
+# Independent pipelines to run in parallel, one mapped task instance each
+PIPELINES = [
+    '/path/to/pipelines/pipeline.yaml',
+]
+
+# Airflow pool capping concurrent mlprep runs (size it to the worker's cores)
+MLPREP_POOL = 'mlprep_pool'
 
 default_args = {
     'owner': 'mlprep_user',
@@ -21,17 +30,21 @@ with DAG(
     tags=['mlprep', 'etl'],
 ) as dag:
 
-    # Task to check/prepare data (placeholder)
-    check_data = BashOperator(
+    # Task to wait for input data (no shell, releases its slot between pokes)
+    check_data = FileSensor(
         task_id='check_input_data',
-        bash_command='[ -f /path/to/data/input.csv ] && echo "Data exists" || exit 1',
+        filepath='/path/to/data/input.csv',
+        poke_interval=60,
+        mode='reschedule',
     )
 
-    # Task to run mlprep
-    # Assumes mlprep is in PATH or specify full path
-    run_mlprep = BashOperator(
-        task_id='run_mlprep_transform',
-        bash_command='mlprep run /path/to/pipelines/pipeline.yaml',
-    )
+    # Task to run mlprep in-process on the worker via the Python API,
+    # mapped over PIPELINES so independent pipelines run concurrently
+    # Assumes the mlprep package is installed in the worker environment
+    @task(task_id='run_mlprep_transform', pool=MLPREP_POOL)
+    def run_mlprep(pipeline_path):
+        import mlprep
+
+        mlprep.run_pipeline(pipeline_path)
 
-    check_data >> run_mlprep
+    check_data >> run_mlprep.expand(pipeline_path=PIPELINES)
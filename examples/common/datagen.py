@@ -0,0 +1,145 @@
+"""Synthetic input data shared by the example pipelines.
+
+Each example's generator script is a thin shim over ``generate``. To produce
+every example input in a single interpreter, run from the repository root:
+
+    python -m examples.common.datagen --all
+"""
+
+import argparse
+import os
+
+import numpy as np
+import polars as pl
+
+EXAMPLES_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Example directory each profile feeds when generated with --all
+PROFILE_DIRS = {
+    'basic': '01_basic_etl',
+    'dirty': '02_data_validation',
+    'train_test': '03_feature_engineering',
+}
+
+# The dirty profile injects its bad values at fixed row indices 0-4
+_MIN_ROWS = {'dirty': 5}
+
+
+def _generate_basic(rng, n_rows, out_dir):
+    data = {
+        'id': np.arange(1, n_rows + 1, dtype=np.int64),
+        'name': np.char.add('User_', np.arange(n_rows).astype(str)),
+        'age': rng.integers(15, 60, size=n_rows),
+        'city': rng.choice(['Tokyo', 'Osaka', 'Nagoya', 'Fukuoka'], size=n_rows),
+        'score': rng.random(n_rows) * 100
+    }
+
+    df = pl.DataFrame(data)
+    df.write_parquet(os.path.join(out_dir, 'data.parquet'), compression='zstd')
+    print(f"Generated data.parquet with {n_rows} rows")
+
+
+def _generate_dirty(rng, n_rows, out_dir):
+    ids = np.arange(n_rows).astype(str)
+    emails = np.char.add(np.char.add('user', ids), '@example.com').astype(object)
+    ages = rng.integers(15, 60, size=n_rows)
+    user_types = rng.choice(['admin', 'user', 'guest'], size=n_rows).astype(object)
+
+    # Introduce bad data
+    # Duplicate emails
+    emails[[0, 1]] = 'duplicate@example.com'
+
+    # Invalid age
+    ages[[2, 3]] = [-5, 150]
+
+    # Null user_type
+    user_types[4] = None
+
+    df = pl.DataFrame({
+        'id': np.arange(1, n_rows + 1, dtype=np.int64),
+        'email': emails,
+        'age': ages,
+        'user_type': user_types
+    })
+
+    df.write_csv(os.path.join(out_dir, 'dirty_data.csv'), batch_size=65536)
+    print(f"Generated dirty_data.csv with {n_rows} rows (including intentional errors)")
+
+
+def _generate_train_test(rng, n_rows, out_dir):
+    n_train = n_rows
+    n_test = max(1, n_rows // 5)
+
+    cities = ['Tokyo', 'Osaka', 'Nagoya', 'Fukuoka']
+
+    # Train Data
+    train = pl.DataFrame({
+        'id': np.arange(1, n_train + 1, dtype=np.int64),
+        'age': rng.integers(20, 60, size=n_train),
+        'income': rng.integers(300, 1000, size=n_train) * 10000,
+        'city': rng.choice(cities, size=n_train)
+    })
+
+    # Test Data (could hold unseen categories if not handled; kept simple here)
+    test = pl.DataFrame({
+        'id': np.arange(n_train + 1, n_train + n_test + 1, dtype=np.int64),
+        'age': rng.integers(20, 60, size=n_test),
+        'income': rng.integers(300, 1000, size=n_test) * 10000,
+        'city': rng.choice(cities, size=n_test)
+    })
+
+    train.write_parquet(os.path.join(out_dir, 'train_data.parquet'), compression='zstd')
+    test.write_parquet(os.path.join(out_dir, 'test_data.parquet'), compression='zstd')
+    print("Generated train_data.parquet and test_data.parquet")
+
+
+_GENERATORS = {
+    'basic': _generate_basic,
+    'dirty': _generate_dirty,
+    'train_test': _generate_train_test,
+}
+
+
+def generate(profile, n_rows=100, seed=42, out_dir='.'):
+    """Generate the input data for one example profile into ``out_dir``."""
+    if profile not in _GENERATORS:
+        raise ValueError(f"Unknown profile: {profile}")
+    if n_rows <= 0:
+        raise ValueError("n_rows must be positive")
+    min_rows = _MIN_ROWS.get(profile, 1)
+    if n_rows < min_rows:
+        raise ValueError(f"the {profile} profile needs at least {min_rows} rows")
+
+    rng = np.random.default_rng(seed)
+    _GENERATORS[profile](rng, n_rows, out_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate example input data")
+    parser.add_argument('profile', nargs='?', choices=sorted(_GENERATORS))
+    parser.add_argument(
+        '--all',
+        action='store_true',
+        help="Generate every profile into its example directory",
+    )
+    parser.add_argument('--rows', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument(
+        '--out-dir',
+        type=str,
+        help="Output directory (default: the example directory with --all, else '.')",
+    )
+    args = parser.parse_args()
+
+    if args.all:
+        for profile, example_dir in PROFILE_DIRS.items():
+            out_dir = args.out_dir or os.path.join(EXAMPLES_DIR, example_dir)
+            generate(profile, args.rows, args.seed, out_dir)
+    elif args.profile:
+        generate(args.profile, args.rows, args.seed, args.out_dir or '.')
+    else:
+        parser.error("a profile or --all is required")
+
+
+if __name__ == "__main__":
+    main()
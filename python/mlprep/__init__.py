@@ -1,5 +1,33 @@
-from .mlprep import *  # noqa: F403, F401
+"""High-performance no-code data preprocessing engine."""
 
-__doc__ = mlprep.__doc__  # noqa: F405
-if hasattr(mlprep, "__all__"):  # noqa: F405
-    __all__ = mlprep.__all__  # noqa: F405
+import importlib
+
+__all__ = [
+    "DataFrame",
+    "read_csv",
+    "read_parquet",
+    "write_parquet",
+    "run_pipeline",
+    "run_pipeline_config",
+    "__version__",
+]
+
+
+def _native():
+    # The Rust extension is loaded on first attribute access so that
+    # `mlprep --help` and other early-exit CLI paths never pay for it.
+    return importlib.import_module(".mlprep", __name__)
+
+
+def __getattr__(name):
+    try:
+        value = getattr(_native(), name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    # Bind into the module namespace so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,39 +1,95 @@
-import argparse
 import sys
 
-import mlprep
-
-
-def main():
-    parser = argparse.ArgumentParser(description="mlprep CLI")
-    subparsers = parser.add_subparsers(dest="command", required=True)
-
-    # run command
-    run_parser = subparsers.add_parser("run", help="Run a pipeline")
-    run_parser.add_argument("pipeline", help="Path to pipeline.yaml")
-    run_parser.add_argument(
-        "--streaming",
-        action="store_true",
-        help="Enable streaming mode (low memory)",
-    )
-    run_parser.add_argument(
-        "--memory-limit",
-        type=str,
-        help='Set memory limit (e.g., "4GB", "500MB")',
-    )
-
-    args = parser.parse_args()
-
-    if args.command == "run":
-        try:
-            mlprep.run_pipeline(
-                args.pipeline,
-                streaming=args.streaming,
-                memory_limit=args.memory_limit,
-            )
-        except Exception as e:
-            print(f"Error: {e}", file=sys.stderr)
-            sys.exit(1)
+__all__ = ["main"]
+
+USAGE = "usage: mlprep run [-h] [--streaming] [--memory-limit MEMORY_LIMIT] pipeline"
+
+HELP = f"""{USAGE}
+
+mlprep CLI
+
+positional arguments:
+  pipeline              Path to pipeline.yaml
+
+options:
+  -h, --help            show this help message and exit
+  --streaming           Enable streaming mode (low memory)
+  --memory-limit MEMORY_LIMIT
+                        Set memory limit (e.g., "4GB", "500MB")
+"""
+
+
+def _error(message):
+    print(USAGE, file=sys.stderr)
+    print(f"mlprep: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+
+def _parse_run_args(argv):
+    """Parse the arguments following `run` into (pipeline, streaming, limit)."""
+    positional = []
+    streaming = False
+    memory_limit = None
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--":
+            # End of options: everything after is positional, like argparse
+            positional.extend(argv[i + 1 :])
+            break
+        elif arg in ("-h", "--help"):
+            print(HELP, end="")
+            sys.exit(0)
+        elif arg == "--streaming":
+            streaming = True
+        elif arg == "--memory-limit":
+            if i + 1 >= len(argv):
+                _error("argument --memory-limit: expected one argument")
+            i += 1
+            memory_limit = argv[i]
+        elif arg.startswith("--memory-limit="):
+            memory_limit = arg.split("=", 1)[1]
+        elif arg.startswith("-") and arg != "-":
+            _error(f"unrecognized arguments: {arg}")
+        else:
+            positional.append(arg)
+        i += 1
+
+    if not positional:
+        _error("the following arguments are required: pipeline")
+    if len(positional) > 1:
+        _error(f"unrecognized arguments: {' '.join(positional[1:])}")
+
+    return positional[0], streaming, memory_limit
+
+
+def main(argv=None):
+    # Hand-rolled parsing keeps CLI start-up free of argparse and the native
+    # extension until a pipeline actually needs to run.
+    argv = sys.argv[1:] if argv is None else argv
+
+    if not argv:
+        _error("the following arguments are required: command")
+    if argv[0] in ("-h", "--help"):
+        print(HELP, end="")
+        sys.exit(0)
+    if argv[0] != "run":
+        _error(f"argument command: invalid choice: '{argv[0]}' (choose from 'run')")
+
+    pipeline, streaming, memory_limit = _parse_run_args(argv[1:])
+
+    import mlprep
+
+    try:
+        mlprep.run_pipeline(
+            pipeline,
+            streaming=streaming,
+            memory_limit=memory_limit,
+        )
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
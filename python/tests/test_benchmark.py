@@ -25,28 +25,47 @@ def test_generate_data_showcase_schema(tmp_path):
     assert "city" in columns
 
 
+def test_generate_data_parquet_matches_csv(tmp_path):
+    """Parquet output carries the same rows as the CSV output."""
+    import polars as pl
+
+    csv_path = tmp_path / "bench.csv"
+    parquet_path = tmp_path / "bench.parquet"
+
+    benchmark.generate_data(str(csv_path), rows=5, profile="showcase", workers=1)
+    benchmark.generate_data(str(parquet_path), rows=5, profile="showcase", workers=1)
+
+    expected = pl.read_csv(csv_path)
+    actual = pl.read_parquet(parquet_path)
+    assert actual.columns == expected.columns
+    assert actual.height == 5
+    assert actual["email"].to_list() == expected["email"].to_list()
+
+
 def test_build_validation_pipeline_includes_quarantine():
     """Validation pipeline should run in quarantine mode."""
-    yaml = benchmark.build_validation_pipeline("input.csv", "output.parquet")
+    config = benchmark.build_validation_pipeline("input.csv", "output.parquet")
 
-    assert "type: validate" in yaml
-    assert "mode: quarantine" in yaml
-    assert "unique: true" in yaml
-    assert "range: [0, 120]" in yaml
+    (step,) = config["steps"]
+    assert step["type"] == "validate"
+    assert step["mode"] == "quarantine"
+    assert {"name": "email", "unique": True} in step["checks"]["columns"]
+    assert {"name": "age", "range": [0, 120]} in step["checks"]["columns"]
 
 
 def test_build_features_pipeline_includes_state_path():
     """Feature pipeline should include state path and transforms."""
-    yaml = benchmark.build_features_pipeline(
+    config = benchmark.build_features_pipeline(
         "input.csv",
         "output.parquet",
         "state.json",
     )
 
-    assert "type: features" in yaml
-    assert 'state_path: "state.json"' in yaml
-    assert "standard_scale" in yaml
-    assert "one_hot_encode" in yaml
+    (step,) = config["steps"]
+    transforms = {f["transform"] for f in step["config"]["features"]}
+    assert step["type"] == "features"
+    assert step["state_path"] == "state.json"
+    assert transforms == {"standard_scale", "one_hot_encode"}
 
 
 def test_render_showcase_markdown_includes_rows_per_sec():
@@ -70,11 +89,48 @@ def test_render_showcase_markdown_includes_rows_per_sec():
 
 def test_build_showcase_pipeline_combines_steps():
     """Showcase pipeline should include validation, features, and runtime block."""
-    yaml = benchmark.build_showcase_pipeline(
+    config = benchmark.build_showcase_pipeline(
         "input.csv", "output.parquet", "state.json", streaming=True
     )
 
-    assert "type: validate" in yaml
-    assert "type: features" in yaml
-    assert "runtime:" in yaml
-    assert "streaming: true" in yaml
+    assert [step["type"] for step in config["steps"]] == ["validate", "features"]
+    assert config["runtime"] == {"streaming": True}
+    assert config["outputs"] == [{"path": "output.parquet", "format": "parquet"}]
+
+
+def test_build_pipeline_without_output_path_omits_outputs():
+    """A None output path yields a pipeline that writes nothing."""
+    config = benchmark.build_groupby_pipeline("input.csv", None)
+
+    assert config["steps"][0]["type"] == "group_by"
+    assert "outputs" not in config
+
+
+def test_config_text_keeps_non_bmp_characters_unescaped():
+    """mlprep's YAML loader rejects the surrogate escapes json emits by default."""
+    text = benchmark._config_text(benchmark.build_groupby_pipeline("in😀.csv", None))
+
+    assert "😀" in text
+    assert "\\ud83d" not in text
+
+
+def test_generate_data_reports_whether_it_wrote(tmp_path):
+    """An existing file is left alone and reported as not generated."""
+    path = tmp_path / "bench.csv"
+
+    assert benchmark.generate_data(str(path), rows=5, workers=1) is True
+    assert benchmark.generate_data(str(path), rows=5, workers=1) is False
+
+
+def test_render_markdown_without_polars_baseline_shows_dash():
+    """Tasks with no Polars row get no speedup figure."""
+    results = [
+        {"task": "Read CSV", "tool": "Polars", "time": 2.0},
+        {"task": "Read CSV", "tool": "mlprep (Library)", "time": 1.0},
+        {"task": "Import", "tool": "Pandas", "time": 0.5},
+    ]
+
+    markdown = benchmark.render_markdown(results)
+
+    assert "| Read CSV | mlprep (Library) | 1.0000 | 2.00x |" in markdown
+    assert "| Import | Pandas | 0.5000 | - |" in markdown
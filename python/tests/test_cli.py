@@ -40,6 +40,25 @@ def test_run_pipeline_streaming_option():
         assert os.path.exists(output_path)
 
 
+def test_run_pipeline_config_accepts_dict():
+    """run_pipeline_config runs a dict config without a pipeline file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        input_path = os.path.join(tmpdir, "input.csv")
+        output_path = os.path.join(tmpdir, "output.csv")
+        with open(input_path, "w") as f:
+            f.write("a,b\n1,2\n3,4\n")
+
+        config = {
+            "inputs": [{"path": input_path}],
+            "steps": [{"type": "select", "columns": ["a"]}],
+            "outputs": [{"path": output_path, "format": "csv"}],
+        }
+        mlprep.run_pipeline_config(config, lineage_dir=tmpdir, streaming=True)
+
+        assert os.path.exists(output_path)
+        assert any(name.startswith("lineage_") for name in os.listdir(tmpdir))
+
+
 def test_cli_streaming_flag():
     """`python -m mlprep run ... --streaming` works."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -64,3 +83,61 @@ def test_cli_streaming_flag():
 
         assert result.returncode == 0, result.stderr
         assert os.path.exists(output_path)
+
+
+def test_cli_help_exits_zero():
+    """`python -m mlprep --help` prints usage and exits cleanly."""
+    cmd = [sys.executable, "-m", "mlprep", "run", "--help"]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+    assert "--streaming" in result.stdout
+    assert "--memory-limit" in result.stdout
+
+
+def test_cli_missing_pipeline_is_usage_error():
+    """Missing positional pipeline is reported like argparse (exit code 2)."""
+    cmd = [sys.executable, "-m", "mlprep", "run", "--streaming"]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+
+    assert result.returncode == 2
+    assert "the following arguments are required: pipeline" in result.stderr
+
+
+def test_cli_help_does_not_load_native_extension():
+    """`--help` exits before the Rust extension module is imported."""
+    code = (
+        "import sys\n"
+        "from mlprep.cli import main\n"
+        "try:\n"
+        "    main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "assert 'mlprep.mlprep' not in sys.modules\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_cli_double_dash_ends_options():
+    """A pipeline path after `--` is positional even if it starts with `-`."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        input_path = os.path.join(tmpdir, "input.csv")
+        output_path = os.path.join(tmpdir, "output.csv")
+        with open(input_path, "w") as f:
+            f.write("a,b\n1,2\n")
+
+        pipeline_path = _write_pipeline(tmpdir, input_path, output_path)
+        dashed_path = os.path.join(tmpdir, "-pipeline.yaml")
+        os.rename(pipeline_path, dashed_path)
+
+        cmd = [sys.executable, "-m", "mlprep", "run", "--streaming", "--"]
+        result = subprocess.run(
+            cmd + ["-pipeline.yaml"], capture_output=True, text=True, cwd=tmpdir
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert os.path.exists(output_path)
@@ -91,6 +91,21 @@ class TestWriteParquet:
             result = pl.read_parquet(parquet_path)
             assert result.shape == (2, 3)
 
+    def test_write_parquet_row_group_size(self):
+        """row_group_size controls how many row groups are written."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            csv_path = os.path.join(tmpdir, "test.csv")
+            parquet_path = os.path.join(tmpdir, "output.parquet")
+
+            with open(csv_path, "w") as f:
+                f.write("x\n1\n2\n3\n4\n5\n")
+
+            df = mlprep.read_csv(csv_path)
+            mlprep.write_parquet(df, parquet_path, row_group_size=2)
+
+            assert pq.ParquetFile(parquet_path).metadata.num_row_groups == 3
+
 
 class TestRoundtrip:
     """Tests for CSV -> DataFrame -> Parquet -> DataFrame roundtrip."""
@@ -144,3 +159,57 @@ class TestToPolars:
             assert filtered.shape == (1, 2)
         finally:
             os.unlink(csv_path)
+
+
+class TestPackageExports:
+    """Tests for the public names of the mlprep package."""
+
+    def test_public_api_is_explicit(self):
+        """Every name in __all__ resolves from the native extension."""
+        for name in mlprep.__all__:
+            assert getattr(mlprep, name) is not None
+
+    def test_star_import_exposes_public_api(self):
+        """`from mlprep import *` binds exactly the public API."""
+        namespace = {}
+        exec("from mlprep import *", namespace)
+
+        assert "read_csv" in namespace
+        assert "run_pipeline" in namespace
+        assert "_native" not in namespace
+
+
+class TestArrowExport:
+    """Tests for the Arrow C stream / PyArrow export of PyDataFrame."""
+
+    def test_polars_constructor_accepts_arrow_stream(self):
+        """`pl.DataFrame(df)` consumes the Arrow PyCapsule stream."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write("a,b\n1,x\n2,y\n")
+            csv_path = f.name
+
+        try:
+            df = mlprep.read_csv(csv_path)
+            assert hasattr(df, "__arrow_c_stream__")
+
+            pl_df = pl.DataFrame(df)
+            assert pl_df.shape == (2, 2)
+            assert pl_df["b"].to_list() == ["x", "y"]
+        finally:
+            os.unlink(csv_path)
+
+    def test_to_arrow_shares_numeric_buffers(self):
+        """Repeated to_arrow() calls expose the same numeric column memory."""
+        pytest.importorskip("pyarrow")
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write("a,b\n1,2\n3,4\n")
+            csv_path = f.name
+
+        try:
+            df = mlprep.read_csv(csv_path)
+            first = df.to_arrow().column("a").chunk(0).buffers()[1]
+            second = df.to_arrow().column("a").chunk(0).buffers()[1]
+
+            assert first.address == second.address
+        finally:
+            os.unlink(csv_path)
@@ -1,19 +1,127 @@
 import os
+
+# Pin the Polars thread pool for every timing; it is sized when polars is
+# first loaded, so this has to run before the import below
+os.environ.setdefault("POLARS_MAX_THREADS", str(os.cpu_count() or 1))
+
+import cProfile
+import multiprocessing
+import re
+import shutil
+import sys
 import tempfile
 import time
 import argparse
 import polars as pl
 import subprocess
 import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import mlprep
 
+# Imported once by import_pandas() when the Pandas baselines are enabled
+pd = None
+
 CORE_COLUMNS = ["a", "b", "c", "group_key"]
 SHOWCASE_COLUMNS = ["email", "age", "income", "city"]
 
-def generate_data(path, size_gb=1, rows=None, profile="core"):
+# group_key/city take only 100/10 distinct values: gather them from these
+# lookups instead of formatting one string per row
+GROUP_KEYS = [f"key_{k}" for k in range(100)]
+CITIES = [f"city_{k}" for k in range(10)]
+
+
+def _lookup(values, index):
+    return pl.lit(pl.Series(values)).gather(index)
+
+
+def _chunk_columns(profile):
+    invalid_every = max(1, int(1 / 0.01))
+
+    a = pl.col("a")
+    columns = [
+        pl.lit(1.5).alias("b"),
+        pl.lit("test_string_value").alias("c"),
+        _lookup(GROUP_KEYS, a % len(GROUP_KEYS)).alias("group_key"),
+    ]
+
+    if profile == "showcase":
+        invalid = (a % invalid_every) == 0
+        columns.extend(
+            [
+                pl.when(invalid)
+                .then(pl.lit("dup@example.com"))
+                .otherwise(pl.format("user_{}@example.com", a))
+                .alias("email"),
+                pl.when(invalid).then(pl.lit(-1)).otherwise(a % 100 + 18).alias("age"),
+                (pl.lit(30000.0) + a % 1000).alias("income"),
+                _lookup(CITIES, a % len(CITIES)).alias("city"),
+            ]
+        )
+
+    return columns
+
+
+def _generate_chunk(start, length, columns):
+    # Building the chunk in Polars and letting write_csv format it beats
+    # hand-formatting the lines: on 1M core rows, bytes %-formatting is ~3x
+    # slower and np.savetxt ~15x slower, with byte-identical output.
+    return pl.select(
+        a=pl.int_range(start, start + length, dtype=pl.Int64)
+    ).with_columns(columns)
+
+
+def _is_parquet(path):
+    return path.endswith(".parquet")
+
+
+def _write_chunk_part(task):
+    """Process-pool worker: write one chunk to its own part file.
+
+    CSV parts carry no header so they can be concatenated byte-for-byte.
+    """
+    part_path, start, length, profile = task
+    df = _generate_chunk(start, length, _chunk_columns(profile))
+    if _is_parquet(part_path):
+        df.write_parquet(part_path, compression="zstd", statistics=True)
+    else:
+        with open(part_path, "wb") as f:
+            df.write_csv(f, include_header=False)
+    return part_path
+
+
+def _chunk_tasks(tmpdir, starts, num_rows, chunk_size, profile, ext):
+    return [
+        (
+            os.path.join(tmpdir, f"part_{n:05d}.{ext}"),
+            i,
+            min(chunk_size, num_rows - i),
+            profile,
+        )
+        for n, i in enumerate(starts)
+    ]
+
+
+def _map_chunk_parts(tasks, workers):
+    """Yield part paths in task order, in a process pool when workers > 1."""
+    if workers <= 1:
+        for task in tasks:
+            yield _write_chunk_part(task)
+        return
+
+    # spawn, not fork: the parent's Polars thread pool is not fork-safe
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as ex:
+        yield from ex.map(_write_chunk_part, tasks)
+
+
+def generate_data(path, size_gb=1, rows=None, profile="core", workers=None):
+    """Generate benchmark data; `.parquet` paths are written as Parquet, else CSV.
+
+    Returns True if the file was written, False if it already existed.
+    """
     if os.path.exists(path):
         print(f"Data already exists at {path}")
-        return
+        return False
 
     if profile not in ("core", "showcase"):
         raise ValueError(f"Unknown profile: {profile}")
@@ -29,50 +137,60 @@ def generate_data(path, size_gb=1, rows=None, profile="core"):
 
     chunk_size = 1_000_000
     header = CORE_COLUMNS + (SHOWCASE_COLUMNS if profile == "showcase" else [])
-
-    with open(path, "w") as f:
-        f.write(",".join(header) + "\n")
+    starts = range(0, num_rows, chunk_size)
+    workers = min(workers or os.cpu_count() or 1, len(starts))
+    out_dir = os.path.dirname(os.path.abspath(path))
 
     print(f"Generating {num_rows} rows in chunks...")
-    invalid_every = max(1, int(1 / 0.01))
 
-    for i in range(0, num_rows, chunk_size):
-        current_chunk = min(chunk_size, num_rows - i)
-        indexes = range(i, i + current_chunk)
-        data = {
-            "a": range(i, i + current_chunk),
-            "b": [1.5] * current_chunk,
-            "c": ["test_string_value"] * current_chunk,
-            "group_key": [f"key_{x % 100}" for x in indexes],
-        }
-
-        if profile == "showcase":
-            data.update(
-                {
-                    "email": [
-                        "dup@example.com" if x % invalid_every == 0 else f"user_{x}@example.com"
-                        for x in indexes
-                    ],
-                    "age": [
-                        -1 if x % invalid_every == 0 else (x % 100) + 18
-                        for x in indexes
-                    ],
-                    "income": [30000.0 + (x % 1000) for x in indexes],
-                    "city": [f"city_{x % 10}" for x in indexes],
-                }
+    if _is_parquet(path):
+        # Write each chunk as its own Parquet file, then stream them into one
+        with tempfile.TemporaryDirectory(dir=out_dir) as tmpdir:
+            tasks = _chunk_tasks(
+                tmpdir, starts, num_rows, chunk_size, profile, "parquet"
             )
-
-        df = pl.DataFrame(data)
-        with open(path, "a") as f:
-            df.write_csv(f, include_header=False)
+            for _ in _map_chunk_parts(tasks, workers):
+                pass
+            pl.scan_parquet(os.path.join(tmpdir, "part_*.parquet")).sink_parquet(
+                path, compression="zstd", statistics=True
+            )
+        print(f"Data generated at {path}")
+        return True
+
+    # One handle for the whole file: header once, then every chunk appended
+    with open(path, "wb") as f:
+        f.write((",".join(header) + "\n").encode())
+
+        if workers <= 1:
+            columns = _chunk_columns(profile)
+            for i in starts:
+                current_chunk = min(chunk_size, num_rows - i)
+                _generate_chunk(i, current_chunk, columns).write_csv(
+                    f, include_header=False
+                )
+        else:
+            # Chunks are independent: generate them in parallel into part files
+            # next to the output, then append the parts in order.
+            with tempfile.TemporaryDirectory(dir=out_dir) as tmpdir:
+                tasks = _chunk_tasks(
+                    tmpdir, starts, num_rows, chunk_size, profile, "csv"
+                )
+                for part_path in _map_chunk_parts(tasks, workers):
+                    with open(part_path, "rb") as part:
+                        shutil.copyfileobj(part, f)
+                    os.remove(part_path)
 
     print(f"Data generated at {path}")
+    return True
 
 
 def ensure_showcase_schema(path):
-    with open(path, "r") as f:
-        header = f.readline().strip()
-    columns = header.split(",") if header else []
+    if _is_parquet(path):
+        columns = list(pl.read_parquet_schema(path))
+    else:
+        with open(path, "r") as f:
+            header = f.readline().strip()
+        columns = header.split(",") if header else []
     missing = [col for col in SHOWCASE_COLUMNS if col not in columns]
     if missing:
         raise ValueError(
@@ -82,305 +200,588 @@ def ensure_showcase_schema(path):
         )
 
 
-def benchmark_polars_read(path):
-    start = time.time()
-    df = pl.scan_csv(path).collect()
-    end = time.time()
-    return end - start, df.height
-
-def benchmark_mlprep_lib_read(path):
-    start = time.time()
-    df = mlprep.read_csv(path)
-    end = time.time()
-    return end - start, len(df)
-
-def benchmark_groupby(df):
-    start = time.time()
-    _ = df.group_by("group_key").agg(pl.col("b").sum()).collect()
-    end = time.time()
-    return end - start
-
-def benchmark_join(df):
-    # Self join for simplicity
-    other = df.select(["group_key"]).unique().with_columns(pl.lit(1).alias("other_val"))
-    start = time.time()
-    _ = df.join(other, on="group_key", how="inner").collect()
-    end = time.time()
-    return end - start
+def prime_page_cache(path):
+    """Pull `path` into the page cache so every tool reads it from memory."""
+    with open(path, "rb") as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        # WILLNEED is only a hint; reading the file once actually faults it in
+        buf = bytearray(1 << 24)
+        while f.readinto(buf):
+            pass
+
+
+def drop_page_cache(path):
+    """Evict `path` from the page cache so the next read comes from disk."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        # DONTNEED skips dirty pages, so flush this file (not the whole system)
+        os.fsync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+def _read_setup(path, cold):
+    """Put the page cache in the same state before every read of `path`."""
+    if cold:
+        return lambda: drop_page_cache(path)
+    prime_page_cache(path)
+    return None
+
+
+def _bench(fn, repeat=1, warmup=0, setup=None):
+    """Run `fn` `warmup` times untimed, then return (best seconds, last result).
+
+    Taking the minimum of several runs discards cold-cache and allocator noise.
+    `setup`, if given, runs untimed before every call.
+    """
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        fn()
+    best = None
+    result = None
+    for _ in range(max(1, repeat)):
+        if setup is not None:
+            setup()
+        start = time.perf_counter_ns()
+        result = fn()
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / 1e9, result
+
+
+def benchmark_polars_read(path, repeat=1, warmup=0, cold=False):
+    # low_memory=False pins the fast reader path. Scans never rechunk after
+    # parsing (the option was removed in Polars 2.0), so no extra copy here.
+    scan = pl.scan_parquet if _is_parquet(path) else pl.scan_csv
+    return _bench(
+        lambda: scan(path, low_memory=False).collect(),
+        repeat,
+        warmup,
+        setup=_read_setup(path, cold),
+    )
+
+
+class Profiler:
+    """Profile one extra, untimed run of a benchmark into `out_dir`.
+
+    `cprofile` runs the callable in-process and writes `<name>.prof`;
+    `pyspy` records the equivalent command under `py-spy record --native`
+    (so Rust frames are visible) and writes a `<name>.svg` flame graph.
+    """
+
+    def __init__(self, kind, out_dir):
+        self.kind = kind
+        self.out_dir = out_dir
+        os.makedirs(out_dir, exist_ok=True)
+
+    def run(self, name, fn, cmd):
+        name = re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+        if self.kind == "cprofile":
+            out = os.path.join(self.out_dir, f"{name}.prof")
+            with cProfile.Profile() as prof:
+                fn()
+            prof.dump_stats(out)
+        else:
+            out = os.path.join(self.out_dir, f"{name}.svg")
+            result = subprocess.run(
+                ["py-spy", "record", "--native", "-o", out, "--", *cmd],
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode != 0:
+                raise Exception(f"py-spy failed: {result.stderr}")
+        print(f"Profile written to {out}")
+
+
+def _python_cmd(code):
+    return [sys.executable, "-c", f"import mlprep; {code}"]
+
+
+def benchmark_mlprep_lib_read(path, repeat=1, warmup=0, profiler=None, cold=False):
+    read = mlprep.read_parquet if _is_parquet(path) else mlprep.read_csv
+    elapsed, df = _bench(
+        lambda: read(path), repeat, warmup, setup=_read_setup(path, cold)
+    )
+    if profiler is not None:
+        profiler.run(
+            f"{read.__name__} mlprep lib",
+            lambda: read(path),
+            _python_cmd(f"mlprep.{read.__name__}({path!r})"),
+        )
+    return elapsed, len(df)
+
+
+def benchmark_groupby(df, repeat=1, warmup=0):
+    elapsed, _ = _bench(
+        lambda: df.group_by("group_key").agg(pl.col("b").sum()).collect(),
+        repeat,
+        warmup,
+    )
+    return elapsed
+
+
+def benchmark_join(df, repeat=1, warmup=0, keys=None):
+    """Time an inner join of `df` against one row per group key.
+
+    Pass `keys` when they are known (data from `generate_data`) so the right
+    side is built directly; otherwise the distinct keys are collected from
+    `df` once, outside the timed runs.
+    """
+    if keys is not None:
+        other = pl.LazyFrame({"group_key": keys, "other_val": 1})
+    else:
+        other = df.select(["group_key"]).unique().with_columns(other_val=pl.lit(1))
+        other = other.collect().lazy()
+    elapsed, _ = _bench(
+        lambda: df.join(other, on="group_key", how="inner").collect(), repeat, warmup
+    )
+    return elapsed
+
+
+def _pipeline(input_path, steps, output_path, runtime=None):
+    config = {"inputs": [{"path": os.path.abspath(input_path)}], "steps": steps}
+    # No outputs section: mlprep collects the result and writes nothing, which
+    # keeps disk I/O out of the timing
+    if output_path is not None:
+        config["outputs"] = [{"path": output_path, "format": "parquet"}]
+    if runtime is not None:
+        config["runtime"] = runtime
+    return config
+
+
+VALIDATE_STEP = {
+    "type": "validate",
+    "checks": {
+        "columns": [
+            {"name": "email", "unique": True},
+            {"name": "age", "range": [0, 120]},
+        ]
+    },
+    "mode": "quarantine",
+}
+
+
+def _features_step(state_path):
+    return {
+        "type": "features",
+        "config": {
+            "features": [
+                {"column": "age", "transform": "standard_scale"},
+                {"column": "income", "transform": "standard_scale"},
+                {"column": "city", "transform": "one_hot_encode"},
+            ]
+        },
+        "state_path": state_path,
+    }
+
 
 def build_groupby_pipeline(input_path, output_path):
-    return f"""
-inputs:
-  - path: "{os.path.abspath(input_path)}"
-steps:
-  - type: group_by
-    by: ["group_key"]
-    aggs:
-      b:
-        func: "sum"
-        alias: "sum_b"
-outputs:
-  - path: "{output_path}"
-    format: parquet
-"""
+    step = {
+        "type": "group_by",
+        "by": ["group_key"],
+        "aggs": {"b": {"func": "sum", "alias": "sum_b"}},
+    }
+    return _pipeline(input_path, [step], output_path)
 
 
 def build_validation_pipeline(input_path, output_path):
-    return f"""
-inputs:
-  - path: "{os.path.abspath(input_path)}"
-steps:
-  - type: validate
-    checks:
-      columns:
-        - name: email
-          unique: true
-        - name: age
-          range: [0, 120]
-    mode: quarantine
-outputs:
-  - path: "{output_path}"
-    format: parquet
-"""
+    return _pipeline(input_path, [VALIDATE_STEP], output_path)
 
 
 def build_features_pipeline(input_path, output_path, state_path):
-    return f"""
-inputs:
-  - path: "{os.path.abspath(input_path)}"
-steps:
-  - type: features
-    config:
-      features:
-        - column: age
-          transform: standard_scale
-        - column: income
-          transform: standard_scale
-        - column: city
-          transform: one_hot_encode
-    state_path: "{state_path}"
-outputs:
-  - path: "{output_path}"
-    format: parquet
-"""
+    return _pipeline(input_path, [_features_step(state_path)], output_path)
 
 
 def build_showcase_pipeline(input_path, output_path, state_path, streaming=True):
-    runtime = "runtime:\n  streaming: true\n" if streaming else ""
-    return f"""
-{runtime}inputs:
-  - path: "{os.path.abspath(input_path)}"
-steps:
-  - type: validate
-    checks:
-      columns:
-        - name: email
-          unique: true
-        - name: age
-          range: [0, 120]
-    mode: quarantine
-  - type: features
-    config:
-      features:
-        - column: age
-          transform: standard_scale
-        - column: income
-          transform: standard_scale
-        - column: city
-          transform: one_hot_encode
-    state_path: "{state_path}"
-outputs:
-  - path: "{output_path}"
-    format: parquet
-"""
-
-
-def benchmark_mlprep_cli_run(pipeline_yaml, streaming=False):
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as tmp:
-        tmp.write(pipeline_yaml)
+    runtime = {"streaming": True} if streaming else None
+    steps = [VALIDATE_STEP, _features_step(state_path)]
+    return _pipeline(input_path, steps, output_path, runtime=runtime)
+
+
+def _config_text(config):
+    # JSON is valid YAML, so mlprep's loader reads it as-is. ensure_ascii=False:
+    # the loader rejects the escaped surrogate pairs json emits for non-BMP text.
+    return json.dumps(config, ensure_ascii=False)
+
+
+def benchmark_mlprep_lib_run(
+    config, streaming=False, repeat=1, warmup=0, profiler=None, name=None, reset=None
+):
+    """Time an in-process pipeline run, excluding interpreter/import start-up.
+
+    The config dict goes straight to mlprep's loader: no YAML file is written
+    or parsed.
+    """
+    # Lineage goes to a throwaway directory instead of the working directory
+    with tempfile.TemporaryDirectory() as lineage_dir:
+        code = (
+            f"mlprep.run_pipeline_config({_config_text(config)!r}, "
+            f"lineage_dir={lineage_dir!r}, streaming={streaming})"
+        )
+
+        def run():
+            mlprep.run_pipeline_config(
+                config, lineage_dir=lineage_dir, streaming=streaming
+            )
+
+        elapsed, _ = _bench(run, repeat, warmup, setup=reset)
+
+        if profiler is not None:
+            if reset is not None:
+                reset()
+            profiler.run(name, run, _python_cmd(code))
+
+    return elapsed
+
+
+def benchmark_mlprep_run(
+    config,
+    streaming=False,
+    include_cli_startup=False,
+    repeat=1,
+    warmup=0,
+    profiler=None,
+    name=None,
+    reset=None,
+):
+    """Time a pipeline; `reset()` restores its starting state before each run.
+
+    No run may see an earlier run's outputs (a saved feature state would be
+    loaded instead of fitted), so `reset` clears them before every warmup,
+    timed and profiled run.
+    """
+    run = benchmark_mlprep_cli_run if include_cli_startup else benchmark_mlprep_lib_run
+    return run(
+        config,
+        streaming=streaming,
+        repeat=repeat,
+        warmup=warmup,
+        profiler=profiler,
+        name=name,
+        reset=reset,
+    )
+
+
+def benchmark_mlprep_cli_run(
+    config, streaming=False, repeat=1, warmup=0, profiler=None, name=None, reset=None
+):
+    with tempfile.NamedTemporaryFile(
+        mode="w", suffix=".yaml", encoding="utf-8", delete=False
+    ) as tmp:
+        tmp.write(_config_text(config))
         config_path = tmp.name
 
     cmd = ["mlprep", "run", config_path]
     if streaming:
         cmd.append("--streaming")
 
-    start = time.time()
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    end = time.time()
+    def run():
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise Exception(f"CLI failed: {result.stderr}")
+
+    try:
+        elapsed, _ = _bench(run, repeat, warmup, setup=reset)
+
+        if profiler is not None:
+            # Only py-spy can see inside the subprocess; cprofile is rejected
+            # for CLI runs up front
+            if reset is not None:
+                reset()
+            profiler.run(name, None, cmd)
+    finally:
+        os.remove(config_path)
 
-    os.remove(config_path)
+    return elapsed
 
-    if result.returncode != 0:
-        raise Exception(f"CLI failed: {result.stderr}")
 
-    return end - start
+def _host_cpu_flags():
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    return set(line.split(":", 1)[1].split())
+    except OSError:
+        pass
+    return set()
+
+
+def check_native_build():
+    """Warn when mlprep was built for baseline x86-64 on a host with AVX2."""
+    built = getattr(mlprep, "__target_features__", None)
+    if built is None:
+        # Built before the probe existed; nothing to compare against
+        return
+    if "avx2" in _host_cpu_flags() and "avx2" not in built:
+        print(
+            "Warning: mlprep was built without AVX2 but this CPU supports it. "
+            "For host-tuned numbers, rebuild with scripts/build_native.sh "
+            "(RUSTFLAGS='-C target-cpu=native')."
+        )
 
 
 def run_benchmarks(args):
     results = []
+    read_task = "Read Parquet" if _is_parquet(args.path) else "Read CSV"
     
-    # 1. Read CSV
-    print("Benchmarking Read CSV (Polars)...")
-    pl_time, rows = benchmark_polars_read(args.path)
-    results.append({"task": "Read CSV", "tool": "Polars (Python)", "time": pl_time, "rows": rows})
+    # 1. Read input
+    print(f"Benchmarking {read_task} (Polars)...")
+    pl_time, base_df = benchmark_polars_read(
+        args.path, args.repeat, args.warmup, cold=args.cold
+    )
+    rows = base_df.height
+    results.append({"task": read_task, "tool": "Polars (Python)", "time": pl_time, "rows": rows})
     
-    print("Benchmarking Read CSV (mlprep lib)...")
+    print(f"Benchmarking {read_task} (mlprep lib)...")
     try:
-        ml_time, ml_rows = benchmark_mlprep_lib_read(args.path)
-        results.append({"task": "Read CSV", "tool": "mlprep (Lib)", "time": ml_time, "rows": ml_rows})
+        ml_time, ml_rows = benchmark_mlprep_lib_read(
+            args.path, args.repeat, args.warmup, profiler=args.profiler, cold=args.cold
+        )
+        results.append({"task": read_task, "tool": "mlprep (Lib)", "time": ml_time, "rows": ml_rows})
     except Exception as e:
         print(f"mlprep lib failed: {e}")
-        results.append({"task": "Read CSV", "tool": "mlprep (Lib)", "time": -1, "rows": 0, "error": str(e)})
+        results.append({"task": read_task, "tool": "mlprep (Lib)", "time": -1, "rows": 0, "error": str(e)})
 
     # Pandas Baseline (Optional)
     if args.compare_pandas:
-        print("Benchmarking Read CSV (Pandas)...")
-        import pandas as pd
+        results.append(
+            {
+                "task": "Import",
+                "tool": "Pandas",
+                "time": args.pandas_import_time,
+                "rows": 0,
+                "note": "one-time module import",
+            }
+        )
 
-        start = time.time()
-        _ = pd.read_csv(args.path)
-        end = time.time()
-        results.append({"task": "Read CSV", "tool": "Pandas", "time": end - start, "rows": rows})
+        print(f"Benchmarking {read_task} (Pandas)...")
+        pd_time, _ = _bench(
+            lambda: pandas_read(args.path),
+            args.repeat,
+            args.warmup,
+            setup=_read_setup(args.path, args.cold),
+        )
+        results.append({"task": read_task, "tool": "Pandas", "time": pd_time, "rows": rows})
 
     # 2. Ops (using Polars for consistent baseline of "what is possible")
-    # This benchmarks the underlying engine capability
+    # This benchmarks the underlying engine capability. Reuse the frame parsed
+    # above so the op timings measure the engine, not another CSV scan.
     print("Benchmarking GroupBy (Polars)...")
-    lf = pl.scan_csv(args.path)
-    gb_time = benchmark_groupby(lf)
+    lf = base_df.lazy()
+    gb_time = benchmark_groupby(lf, args.repeat, args.warmup)
     results.append({"task": "GroupBy", "tool": "Polars (Native)", "time": gb_time, "rows": rows})
 
     print("Benchmarking Join (Polars)...")
-    join_time = benchmark_join(lf)
+    keys = GROUP_KEYS if args.generated else None
+    join_time = benchmark_join(lf, args.repeat, args.warmup, keys=keys)
     results.append({"task": "Join", "tool": "Polars (Native)", "time": join_time, "rows": rows})
 
-    # 3. CLI (Streaming vs Non-Streaming)
-    print("Benchmarking CLI Run (Standard)...")
-    try:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, "groupby.parquet")
-            pipeline_yaml = build_groupby_pipeline(args.path, output_path)
-            cli_time = benchmark_mlprep_cli_run(pipeline_yaml, streaming=False)
-        results.append({"task": "CLI Run", "tool": "mlprep (CLI)", "time": cli_time, "rows": rows})
-    except Exception as e:
-        print(f"CLI Standard failed: {e}")
-        results.append({"task": "CLI Run", "tool": "mlprep (CLI)", "time": -1, "rows": 0, "error": str(e)})
-
-    print("Benchmarking CLI Run (Streaming)...")
-    try:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, "groupby_stream.parquet")
-            pipeline_yaml = build_groupby_pipeline(args.path, output_path)
-            stream_time = benchmark_mlprep_cli_run(pipeline_yaml, streaming=True)
-        results.append({"task": "CLI Run", "tool": "mlprep (Streaming)", "time": stream_time, "rows": rows})
-    except Exception as e:
-        print(f"CLI Streaming failed: {e}")
-        results.append({"task": "CLI Run", "tool": "mlprep (Streaming)", "time": -1, "rows": 0, "error": str(e)})
-
+    # 3. Pipeline run (Streaming vs Non-Streaming), in-process unless the CLI
+    # start-up cost is explicitly requested
+    jobs = _groupby_pipeline_jobs(args, rows)
     if args.showcase:
-        results.extend(run_showcase_benchmarks(args, rows))
+        jobs.extend(_showcase_pipeline_jobs(args, rows))
+    results.extend(run_pipeline_jobs(jobs, parallel=args.parallel))
+
+    if args.showcase and args.compare_pandas:
+        results.append(
+            benchmark_pandas_showcase(args.path, args.repeat, args.warmup)
+        )
 
     return results
 
 
-def run_showcase_benchmarks(args, rows):
-    results = []
+def _pipeline_job(
+    task,
+    tool,
+    rows,
+    build,
+    streaming,
+    include_cli_startup,
+    note=None,
+    profiler=None,
+    repeat=1,
+    warmup=0,
+):
+    """Describe one pipeline benchmark; `build(tmpdir)` returns its config."""
+
+    def run():
+        print(f"Benchmarking {task} [{tool}]...")
+        result = {"task": task, "tool": tool}
+        try:
+            # Each run gets its own temp dir so concurrent jobs never collide
+            with tempfile.TemporaryDirectory() as tmpdir:
+                result["time"] = benchmark_mlprep_run(
+                    build(tmpdir),
+                    streaming=streaming,
+                    include_cli_startup=include_cli_startup,
+                    repeat=repeat,
+                    warmup=warmup,
+                    profiler=profiler,
+                    name=f"{task} {tool}",
+                    reset=lambda: _clear_dir(tmpdir),
+                )
+            result["rows"] = rows
+        except Exception as e:
+            print(f"{task} ({tool}) failed: {e}")
+            result.update(time=-1, rows=0, error=str(e))
+        if note is not None:
+            result["note"] = note
+        return result
 
-    print("Benchmarking Showcase Pipeline (validate + features, streaming)...")
-    try:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, "showcase.parquet")
-            state_path = os.path.join(tmpdir, "feature_state.json")
-            pipeline_yaml = build_showcase_pipeline(
-                args.path, output_path, state_path, streaming=True
-            )
-            showcase_time = benchmark_mlprep_cli_run(pipeline_yaml, streaming=True)
-        results.append(
-            {
-                "task": "Pipeline (Validation+Features)",
-                "tool": "mlprep (CLI streaming)",
-                "time": showcase_time,
-                "rows": rows,
-                "note": "quarantine + standard/onehot",
-            }
-        )
-    except Exception as e:
-        print(f"Showcase pipeline failed: {e}")
-        results.append(
-            {
-                "task": "Pipeline (Validation+Features)",
-                "tool": "mlprep (CLI streaming)",
-                "time": -1,
-                "rows": 0,
-                "error": str(e),
-                "note": "quarantine + standard/onehot",
-            }
-        )
+    return run
 
-    print("Benchmarking Showcase Pipeline (non-streaming)...")
-    try:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, "showcase_ns.parquet")
-            state_path = os.path.join(tmpdir, "feature_state.json")
-            pipeline_yaml = build_showcase_pipeline(
-                args.path, output_path, state_path, streaming=False
-            )
-            showcase_time = benchmark_mlprep_cli_run(pipeline_yaml, streaming=False)
-        results.append(
-            {
-                "task": "Pipeline (Validation+Features)",
-                "tool": "mlprep (CLI)",
-                "time": showcase_time,
-                "rows": rows,
-                "note": "quarantine + standard/onehot",
-            }
-        )
-    except Exception as e:
-        print(f"Showcase (non-streaming) pipeline failed: {e}")
-        results.append(
-            {
-                "task": "Pipeline (Validation+Features)",
-                "tool": "mlprep (CLI)",
-                "time": -1,
-                "rows": 0,
-                "error": str(e),
-                "note": "quarantine + standard/onehot",
-            }
+
+def _clear_dir(path):
+    """Remove everything under `path`, keeping the directory itself."""
+    for entry in os.scandir(path):
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.remove(entry.path)
+
+
+def _output_path(args, tmpdir, name):
+    return None if args.no_write else os.path.join(tmpdir, name)
+
+
+def _groupby_pipeline_jobs(args, rows):
+    mode = "CLI" if args.include_cli_startup else "Lib"
+    return [
+        _pipeline_job(
+            "Pipeline Run",
+            f"mlprep ({mode})",
+            rows,
+            lambda tmpdir: build_groupby_pipeline(
+                args.path, _output_path(args, tmpdir, "groupby.parquet")
+            ),
+            streaming=False,
+            include_cli_startup=args.include_cli_startup,
+            profiler=args.profiler,
+            repeat=args.repeat,
+            warmup=args.warmup,
+        ),
+        _pipeline_job(
+            "Pipeline Run",
+            f"mlprep ({mode} streaming)",
+            rows,
+            lambda tmpdir: build_groupby_pipeline(
+                args.path, _output_path(args, tmpdir, "groupby_stream.parquet")
+            ),
+            streaming=True,
+            include_cli_startup=args.include_cli_startup,
+            profiler=args.profiler,
+            repeat=args.repeat,
+            warmup=args.warmup,
+        ),
+    ]
+
+
+def _showcase_pipeline_jobs(args, rows):
+    mode = "CLI" if args.include_cli_startup else "Lib"
+    note = "quarantine + standard/onehot"
+
+    def build(streaming):
+        return lambda tmpdir: build_showcase_pipeline(
+            args.path,
+            _output_path(args, tmpdir, "showcase.parquet"),
+            os.path.join(tmpdir, "feature_state.json"),
+            streaming=streaming,
         )
 
-    if args.compare_pandas:
-        print("Benchmarking Pandas baseline (validate + z-score)...")
-        try:
-            import pandas as pd
-
-            start = time.time()
-            df = pd.read_csv(args.path)
-            df = df.drop_duplicates(subset=["email"])
-            df = df[(df["age"] >= 0) & (df["age"] <= 120)]
-            df["age_z"] = (df["age"] - df["age"].mean()) / df["age"].std(ddof=1)
-            pd_time = time.time() - start
-            results.append(
-                {
-                    "task": "Pipeline (Validation+Features)",
-                    "tool": "Pandas",
-                    "time": pd_time,
-                    "rows": len(df),
-                    "note": "drop dup + zscore",
-                }
-            )
-        except Exception as e:
-            print(f"Pandas baseline failed: {e}")
-            results.append(
-                {
-                    "task": "Pipeline (Validation+Features)",
-                    "tool": "Pandas",
-                    "time": -1,
-                    "rows": 0,
-                    "error": str(e),
-                    "note": "drop dup + zscore",
-                }
-            )
+    return [
+        _pipeline_job(
+            "Pipeline (Validation+Features)",
+            f"mlprep ({mode} streaming)",
+            rows,
+            build(True),
+            streaming=True,
+            include_cli_startup=args.include_cli_startup,
+            profiler=args.profiler,
+            repeat=args.repeat,
+            warmup=args.warmup,
+            note=note,
+        ),
+        _pipeline_job(
+            "Pipeline (Validation+Features)",
+            f"mlprep ({mode})",
+            rows,
+            build(False),
+            streaming=False,
+            include_cli_startup=args.include_cli_startup,
+            profiler=args.profiler,
+            repeat=args.repeat,
+            warmup=args.warmup,
+            note=note,
+        ),
+    ]
+
+
+def run_pipeline_jobs(jobs, parallel=False):
+    """Run pipeline jobs one at a time, or overlapped on a thread pool.
+
+    Results come back in job order. Overlapped jobs compete for the CPU (and,
+    in-process, for the one Polars thread pool), so their timings include that
+    contention: use `parallel` only to gather numbers quickly.
+    """
+    workers = min(4, (os.cpu_count() or 1) // 2, len(jobs))
+    if not parallel or workers <= 1:
+        return [job() for job in jobs]
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(lambda job: job(), jobs))
 
-    return results
+
+def import_pandas():
+    """Import pandas for every baseline; return the import time in seconds."""
+    global pd
+    start = time.perf_counter_ns()
+    import pandas
+
+    pd = pandas
+    return (time.perf_counter_ns() - start) / 1e9
+
+
+def pandas_read(path):
+    """Read `path` with pandas at its best: the multithreaded pyarrow engine
+    and Arrow-backed dtypes, so the baseline is not a strawman."""
+    if _is_parquet(path):
+        return pd.read_parquet(path, dtype_backend="pyarrow")
+    return pd.read_csv(path, engine="pyarrow", dtype_backend="pyarrow")
+
+
+def _pandas_showcase(path):
+    df = pandas_read(path)
+    df = df.drop_duplicates(subset=["email"])
+    df = df[df["age"].between(0, 120)]
+    age = df["age"]
+    return df.assign(age_z=age.sub(age.mean()).div(age.std(ddof=1)))
+
+
+def benchmark_pandas_showcase(path, repeat=1, warmup=0):
+    print("Benchmarking Pandas baseline (validate + z-score)...")
+    try:
+        pd_time, df = _bench(lambda: _pandas_showcase(path), repeat, warmup)
+        return {
+            "task": "Pipeline (Validation+Features)",
+            "tool": "Pandas",
+            "time": pd_time,
+            "rows": len(df),
+            "note": "drop dup + zscore",
+        }
+    except Exception as e:
+        print(f"Pandas baseline failed: {e}")
+        return {
+            "task": "Pipeline (Validation+Features)",
+            "tool": "Pandas",
+            "time": -1,
+            "rows": 0,
+            "error": str(e),
+            "note": "drop dup + zscore",
+        }
 
 
 def render_markdown(results):
@@ -389,9 +790,10 @@ def render_markdown(results):
     baselines = {r["task"]: r["time"] for r in results if "Polars" in r["tool"]}
 
     for r in results:
-        baseline = baselines.get(r["task"], r["time"])
+        # Tasks without a Polars row (e.g. the pandas import) have no speedup
+        baseline = baselines.get(r["task"])
         if r["time"] > 0:
-            speedup = f"{baseline / r['time']:.2f}x" if baseline > 0 else "-"
+            speedup = f"{baseline / r['time']:.2f}x" if baseline else "-"
             lines.append(f"| {r['task']} | {r['tool']} | {r['time']:.4f} | {speedup} |")
         else:
             lines.append(f"| {r['task']} | {r['tool']} | FAILED | - |")
@@ -434,8 +836,21 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--size", type=float, default=0.1, help="Size in GB")
     parser.add_argument("--rows", type=int, help="Number of rows to generate (overrides --size)")
-    parser.add_argument("--path", type=str, default="bench_data.csv")
+    parser.add_argument(
+        "--path", type=str, help="Benchmark data file (default: bench_data.<data-format>)"
+    )
+    parser.add_argument(
+        "--data-format",
+        type=str,
+        choices=["csv", "parquet"],
+        help="Format of the generated data (default: from --path, else csv)",
+    )
     parser.add_argument("--generate", action="store_true")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Processes used to generate data chunks (default: CPU count)",
+    )
     parser.add_argument(
         "--format",
         type=str,
@@ -462,6 +877,49 @@ if __name__ == "__main__":
         action="store_false",
         help="Skip showcase workloads",
     )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Timed runs per benchmark, pipelines included; the minimum is reported",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        help="Untimed warmup runs before each benchmark",
+    )
+    parser.add_argument(
+        "--cold",
+        action="store_true",
+        help="Evict the input from the page cache before each read (default: prime it)",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=["cprofile", "pyspy"],
+        help="Profile one extra, untimed run of each mlprep benchmark",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=str,
+        default="profiles",
+        help="Where --profile writes .prof / .svg files (default: profiles)",
+    )
+    parser.add_argument(
+        "--no-write",
+        action="store_true",
+        help="Run pipelines without an output so timings exclude the Parquet write",
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Overlap pipeline benchmarks (faster, but timings include contention)",
+    )
+    parser.add_argument(
+        "--include-cli-startup",
+        action="store_true",
+        help="Time pipelines via the `mlprep` CLI subprocess (includes start-up cost)",
+    )
     pandas_group = parser.add_mutually_exclusive_group()
     pandas_group.add_argument(
         "--compare-pandas",
@@ -478,14 +936,53 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
+    if args.cold and not hasattr(os, "posix_fadvise"):
+        parser.error("--cold requires os.posix_fadvise (Linux/POSIX)")
+    if args.profile == "pyspy" and shutil.which("py-spy") is None:
+        parser.error("--profile pyspy requires py-spy on PATH (pip install py-spy)")
+    if args.profile and args.parallel:
+        parser.error("--profile cannot be combined with --parallel")
+    if args.profile == "cprofile" and args.include_cli_startup:
+        parser.error(
+            "--profile cprofile cannot see inside the CLI subprocess; "
+            "use --profile pyspy with --include-cli-startup"
+        )
+    args.profiler = Profiler(args.profile, args.profile_dir) if args.profile else None
+
+    if args.path is None:
+        args.path = f"bench_data.{args.data_format or 'csv'}"
+    elif args.data_format is not None and _is_parquet(args.path) != (
+        args.data_format == "parquet"
+    ):
+        parser.error(
+            f"--path {args.path} does not match --data-format {args.data_format}"
+        )
+
     if args.showcase and args.schema == "core" and (args.generate or not os.path.exists(args.path)):
         args.schema = "showcase"
 
+    # Freshly generated data has the known key set, so the Join benchmark can
+    # skip collecting it
+    args.generated = False
     if args.generate or not os.path.exists(args.path):
-        generate_data(args.path, size_gb=args.size, rows=args.rows, profile=args.schema)
+        args.generated = generate_data(
+            args.path,
+            size_gb=args.size,
+            rows=args.rows,
+            profile=args.schema,
+            workers=args.workers,
+        )
 
     if args.showcase:
         ensure_showcase_schema(args.path)
 
+    if args.compare_pandas:
+        try:
+            args.pandas_import_time = import_pandas()
+        except ImportError as e:
+            print(f"Skipping Pandas baselines: {e}")
+            args.compare_pandas = False
+
+    check_native_build()
     results = run_benchmarks(args)
     print_results(results, args.format)
@@ -0,0 +1,19 @@
+#!/usr/bin/env bash
+# Build mlprep (Python extension and CLI) tuned for the CPU of this machine.
+#
+# target-cpu=native lets rustc and Polars use every SIMD extension the host
+# supports (AVX2, AVX-512, ...) instead of the x86-64 baseline (SSE2). The
+# result is NOT portable: only use it for local benchmarking.
+#
+# [profile.release] already enables fat LTO and codegen-units = 1.
+set -euo pipefail
+
+cd "$(dirname "$0")/.."
+
+export RUSTFLAGS="${RUSTFLAGS:-} -C target-cpu=native"
+
+cargo build --release --bin mlprep
+maturin develop --release
+
+echo "Built with RUSTFLAGS='${RUSTFLAGS}'"
+echo "CLI: target/release/mlprep"
@@ -1,6 +1,7 @@
 use serde::de::Error;
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
+use std::num::NonZeroUsize;
 
 #[derive(Debug, Serialize, Deserialize, PartialEq, Clone)]
 pub struct Pipeline {
@@ -65,6 +66,10 @@ pub struct Output {
     pub format: Option<String>,
     pub compression: Option<String>,
     pub partition_by: Option<Vec<String>>,
+    /// Rows per Parquet row group (Parquet outputs only); 0 is rejected
+    /// while the pipeline is loaded
+    #[serde(default)]
+    pub row_group_size: Option<NonZeroUsize>,
 }
 
 #[derive(Debug, Serialize, Deserialize, PartialEq, Clone, Default)]
@@ -285,6 +290,21 @@ steps:
         }
     }
 
+    #[test]
+    fn test_deserialize_output_row_group_size() {
+        let yaml = r#"
+steps: []
+outputs:
+  - path: "out.parquet"
+    row_group_size: 1000
+"#;
+        let pipeline: Pipeline = serde_yaml::from_str(yaml).unwrap();
+        assert_eq!(pipeline.outputs[0].row_group_size, NonZeroUsize::new(1000));
+
+        let zero = yaml.replace("1000", "0");
+        assert!(serde_yaml::from_str::<Pipeline>(&zero).is_err());
+    }
+
     #[test]
     fn test_deserialize_filter() {
         let yaml = r#"
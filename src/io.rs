@@ -1,7 +1,14 @@
 use crate::errors::{MlPrepError, MlPrepResult};
 use polars::prelude::*;
+use std::num::NonZeroUsize;
 use std::path::Path;
 
+/// Default rows per Parquet row group.
+///
+/// Several row groups per file let readers decode in parallel, stream, and
+/// skip groups via statistics; smaller groups add more footer metadata.
+pub const DEFAULT_ROW_GROUP_SIZE: NonZeroUsize = NonZeroUsize::new(128 * 1024).unwrap();
+
 pub fn read_csv<P: AsRef<Path>>(path: P) -> MlPrepResult<LazyFrame> {
     LazyCsvReader::new(path)
         .finish()
@@ -12,10 +19,15 @@ pub fn read_parquet<P: AsRef<Path>>(path: P) -> MlPrepResult<LazyFrame> {
     LazyFrame::scan_parquet(path, Default::default()).map_err(MlPrepError::PolarsError)
 }
 
-pub fn write_parquet<P: AsRef<Path>>(df: DataFrame, path: P) -> MlPrepResult<()> {
+pub fn write_parquet<P: AsRef<Path>>(
+    mut df: DataFrame,
+    path: P,
+    row_group_size: NonZeroUsize,
+) -> MlPrepResult<()> {
     let file = std::fs::File::create(path).map_err(MlPrepError::IoError)?;
     ParquetWriter::new(file)
-        .finish(&mut df.clone())
+        .with_row_group_size(Some(row_group_size.get()))
+        .finish(&mut df)
         .map_err(MlPrepError::PolarsError)?;
     Ok(())
 }
@@ -51,7 +63,7 @@ mod tests {
         let df = read_csv(csv_path)?
             .collect()
             .map_err(MlPrepError::PolarsError)?;
-        write_parquet(df, parquet_path)?;
+        write_parquet(df, parquet_path, DEFAULT_ROW_GROUP_SIZE)?;
 
         let lf = read_parquet(parquet_path)?;
         let df_read = lf.collect().map_err(MlPrepError::PolarsError)?;
@@ -62,4 +74,22 @@ mod tests {
         fs::remove_file(parquet_path).map_err(MlPrepError::IoError)?;
         Ok(())
     }
+
+    #[test]
+    fn test_parquet_row_group_size() -> MlPrepResult<()> {
+        let parquet_path = "test_row_groups.parquet";
+        let df = df! {
+            "a" => (0..10i64).collect::<Vec<_>>(),
+        }
+        .unwrap();
+        write_parquet(df, parquet_path, NonZeroUsize::new(3).unwrap())?;
+
+        let file = fs::File::open(parquet_path)?;
+        let mut reader = ParquetReader::new(file);
+        let metadata = reader.get_metadata().map_err(MlPrepError::PolarsError)?;
+        assert_eq!(metadata.row_groups.len(), 4);
+
+        fs::remove_file(parquet_path)?;
+        Ok(())
+    }
 }
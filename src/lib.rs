@@ -10,9 +10,11 @@ pub mod security;
 pub mod validate;
 
 use polars::prelude::*;
-use pyo3::exceptions::{PyIOError, PyRuntimeError};
+use pyo3::exceptions::{PyIOError, PyRuntimeError, PyValueError};
 use pyo3::prelude::*;
+use pyo3::types::PyDict;
 use pyo3_polars::PyDataFrame;
+use std::num::NonZeroUsize;
 use std::path::PathBuf;
 use uuid::Uuid;
 
@@ -31,6 +33,30 @@ impl MlPrepDataFrame {
         Ok(py_df.into_pyobject(py)?.into_any().unbind())
     }
 
+    /// Convert to a PyArrow Table (requires pyarrow)
+    ///
+    /// Numeric column buffers are shared with the underlying DataFrame.
+    /// String columns are converted to `large_string`, which copies them.
+    fn to_arrow<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        self.to_polars(py)?.bind(py).call_method0("to_arrow")
+    }
+
+    /// Export as an Arrow C stream (Arrow PyCapsule interface)
+    ///
+    /// Lets `pl.DataFrame(df)`, `pyarrow.table(df)` and other Arrow consumers
+    /// take the data through the C Data Interface, without a PyArrow
+    /// dependency.
+    #[pyo3(signature = (requested_schema=None))]
+    fn __arrow_c_stream__<'py>(
+        &self,
+        py: Python<'py>,
+        requested_schema: Option<Bound<'py, PyAny>>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        self.to_polars(py)?
+            .bind(py)
+            .call_method1("__arrow_c_stream__", (requested_schema,))
+    }
+
     fn __len__(&self) -> usize {
         self.inner.height()
     }
@@ -67,16 +93,37 @@ fn read_parquet(path: &str) -> PyResult<MlPrepDataFrame> {
 }
 
 /// Write a DataFrame to a Parquet file
-#[pyfunction]
-fn write_parquet(df: &MlPrepDataFrame, path: &str) -> PyResult<()> {
-    io::write_parquet(df.inner.clone(), path)
+///
+/// `row_group_size` sets rows per row group; smaller groups give readers more
+/// parallelism and finer projection/predicate skipping at the cost of metadata.
+#[pyfunction(signature = (df, path, row_group_size=io::DEFAULT_ROW_GROUP_SIZE.get()))]
+fn write_parquet(df: &MlPrepDataFrame, path: &str, row_group_size: usize) -> PyResult<()> {
+    let row_group_size = NonZeroUsize::new(row_group_size)
+        .ok_or_else(|| PyValueError::new_err("row_group_size must be positive"))?;
+    io::write_parquet(df.inner.clone(), path, row_group_size)
         .map_err(|e| PyIOError::new_err(format!("Failed to write Parquet: {}", e)))?;
     Ok(())
 }
 
+fn build_runtime_override(
+    streaming: Option<bool>,
+    memory_limit: Option<String>,
+) -> Option<crate::dsl::RuntimeConfig> {
+    if streaming.unwrap_or(false) || memory_limit.is_some() {
+        Some(crate::dsl::RuntimeConfig {
+            streaming: streaming.unwrap_or(false),
+            memory_limit,
+            ..Default::default()
+        })
+    } else {
+        None
+    }
+}
+
 /// Run a pipeline from a YAML configuration file path
 #[pyfunction(signature = (path, streaming=None, memory_limit=None))]
 fn run_pipeline(
+    py: Python<'_>,
     path: String,
     streaming: Option<bool>,
     memory_limit: Option<String>,
@@ -88,28 +135,86 @@ fn run_pipeline(
         allowed_paths: None,
         mask_columns: None,
     };
-    let runtime_override = if streaming.unwrap_or(false) || memory_limit.is_some() {
-        Some(crate::dsl::RuntimeConfig {
-            streaming: streaming.unwrap_or(false),
-            memory_limit,
-            ..Default::default()
-        })
-    } else {
-        None
+    let runtime_override = build_runtime_override(streaming, memory_limit);
+    // Release the GIL so pipelines can run concurrently from Python threads
+    py.allow_threads(|| {
+        runner::execution_pipeline(&path_buf, run_id, security_config, runtime_override)
+    })
+    .map_err(|e| PyRuntimeError::new_err(format!("Pipeline execution failed: {}", e)))?;
+    Ok(())
+}
+
+/// Run a pipeline from a config dict (or YAML/JSON text) without a file
+#[pyfunction(signature = (config, lineage_dir=None, streaming=None, memory_limit=None))]
+fn run_pipeline_config(
+    py: Python<'_>,
+    config: &Bound<'_, PyAny>,
+    lineage_dir: Option<String>,
+    streaming: Option<bool>,
+    memory_limit: Option<String>,
+) -> PyResult<()> {
+    // JSON is a subset of YAML, so a dict goes through the same loader.
+    // ensure_ascii=False: the loader rejects the \uXXXX surrogate pairs that
+    // json.dumps would otherwise emit for non-BMP characters.
+    let config: String = match config.extract::<String>() {
+        Ok(text) => text,
+        Err(_) => {
+            let kwargs = PyDict::new(py);
+            kwargs.set_item("ensure_ascii", false)?;
+            py.import("json")?
+                .call_method("dumps", (config,), Some(&kwargs))?
+                .extract()?
+        }
+    };
+    let lineage_dir = PathBuf::from(lineage_dir.unwrap_or_else(|| ".".to_string()));
+    let run_id = Uuid::new_v4();
+    let security_config = crate::security::SecurityConfig {
+        allowed_paths: None,
+        mask_columns: None,
     };
-    runner::execution_pipeline(&path_buf, run_id, security_config, runtime_override)
-        .map_err(|e| PyRuntimeError::new_err(format!("Pipeline execution failed: {}", e)))?;
+    let runtime_override = build_runtime_override(streaming, memory_limit);
+    py.allow_threads(|| {
+        runner::execution_pipeline_from_str(
+            &config,
+            &lineage_dir,
+            run_id,
+            security_config,
+            runtime_override,
+        )
+    })
+    .map_err(|e| PyRuntimeError::new_err(format!("Pipeline execution failed: {}", e)))?;
     Ok(())
 }
 
+/// SIMD extensions this build was compiled for, so callers can spot a
+/// generic (baseline-only) build on a more capable CPU
+fn target_features() -> Vec<&'static str> {
+    let mut features = Vec::new();
+    if cfg!(target_feature = "sse4.2") {
+        features.push("sse4.2");
+    }
+    if cfg!(target_feature = "avx2") {
+        features.push("avx2");
+    }
+    if cfg!(target_feature = "avx512f") {
+        features.push("avx512f");
+    }
+    if cfg!(target_feature = "neon") {
+        features.push("neon");
+    }
+    features
+}
+
 /// A Python module implemented in Rust.
 #[pymodule]
 fn mlprep(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add("__version__", "0.3.0")?;
+    m.add("__target_features__", target_features())?;
     m.add_class::<MlPrepDataFrame>()?;
     m.add_function(wrap_pyfunction!(read_csv, m)?)?;
     m.add_function(wrap_pyfunction!(read_parquet, m)?)?;
     m.add_function(wrap_pyfunction!(write_parquet, m)?)?;
     m.add_function(wrap_pyfunction!(run_pipeline, m)?)?;
+    m.add_function(wrap_pyfunction!(run_pipeline_config, m)?)?;
     Ok(())
 }
@@ -8,7 +8,7 @@ use indicatif::{ProgressBar, ProgressStyle};
 use polars::prelude::*;
 use serde::de::Error;
 use std::env;
-use std::path::PathBuf;
+use std::path::{Path, PathBuf};
 use std::time::Instant;
 use tracing::{info, warn};
 use uuid::Uuid;
@@ -39,22 +39,27 @@ fn apply_runtime_env(runtime: &crate::dsl::RuntimeConfig) {
     }
 }
 
+fn new_security_context(
+    security_config: crate::security::SecurityConfig,
+) -> MlPrepResult<crate::security::SecurityContext> {
+    crate::security::SecurityContext::new(security_config).map_err(|e| {
+        MlPrepError::ConfigError(
+            serde_yaml::Error::custom(format!("Security context init failed: {}", e)),
+            None,
+        )
+    })
+}
+
 pub fn execution_pipeline(
     path: &PathBuf,
     run_id: Uuid,
     security_config: crate::security::SecurityConfig,
     runtime_override: Option<crate::dsl::RuntimeConfig>,
 ) -> MlPrepResult<()> {
-    let mut metrics = Metrics::new();
     info!("Loading pipeline from {:?}", path);
 
     // 0. Security Context
-    let security_context = crate::security::SecurityContext::new(security_config).map_err(|e| {
-        MlPrepError::ConfigError(
-            serde_yaml::Error::custom(format!("Security context init failed: {}", e)),
-            None,
-        )
-    })?;
+    let security_context = new_security_context(security_config)?;
 
     // Validate pipeline file path
     security_context.validate_path(path).map_err(|e| {
@@ -65,6 +70,47 @@ pub fn execution_pipeline(
     })?;
 
     let pipeline = Pipeline::from_path(path)?;
+    let lineage_dir = path.parent().unwrap_or_else(|| Path::new("."));
+    run(
+        pipeline,
+        lineage_dir,
+        run_id,
+        &security_context,
+        runtime_override,
+    )
+}
+
+/// Run a pipeline given as YAML (or JSON) text instead of a file.
+///
+/// Lineage is written to `lineage_dir`, which stands in for the directory a
+/// pipeline file would live in.
+pub fn execution_pipeline_from_str(
+    config: &str,
+    lineage_dir: &Path,
+    run_id: Uuid,
+    security_config: crate::security::SecurityConfig,
+    runtime_override: Option<crate::dsl::RuntimeConfig>,
+) -> MlPrepResult<()> {
+    info!("Loading pipeline from string ({} bytes)", config.len());
+    let security_context = new_security_context(security_config)?;
+    let pipeline = Pipeline::from_reader(config.as_bytes())?;
+    run(
+        pipeline,
+        lineage_dir,
+        run_id,
+        &security_context,
+        runtime_override,
+    )
+}
+
+fn run(
+    pipeline: Pipeline,
+    lineage_dir: &Path,
+    run_id: Uuid,
+    security_context: &crate::security::SecurityContext,
+    runtime_override: Option<crate::dsl::RuntimeConfig>,
+) -> MlPrepResult<()> {
+    let mut metrics = Metrics::new();
 
     // Determine runtime configuration (pipeline config + CLI overrides)
     let mut runtime = pipeline.runtime.clone().unwrap_or_default();
@@ -138,7 +184,7 @@ pub fn execution_pipeline(
 
     pb.set_message("Building execution graph...");
     let start_build = Instant::now();
-    let processed_dp = dp.apply_transforms(pipeline.clone(), &runtime, &security_context)?;
+    let processed_dp = dp.apply_transforms(pipeline.clone(), &runtime, security_context)?;
     metrics.record_step("build_graph", start_build.elapsed());
     pb.finish_with_message("Execution graph built.");
 
@@ -191,7 +237,13 @@ pub fn execution_pipeline(
 
     let start_write = Instant::now();
     if output_conf.path.ends_with(".parquet") {
-        io::write_parquet(final_df.clone(), &output_conf.path)?;
+        io::write_parquet(
+            final_df.clone(),
+            &output_conf.path,
+            output_conf
+                .row_group_size
+                .unwrap_or(io::DEFAULT_ROW_GROUP_SIZE),
+        )?;
     } else {
         // Fallback for CSV
         if output_conf.path.ends_with(".csv") {
@@ -222,10 +274,7 @@ pub fn execution_pipeline(
 
     // Write lineage.json
     let lineage_filename = format!("lineage_{}.json", run_id);
-    let lineage_path = path
-        .parent()
-        .unwrap_or_else(|| std::path::Path::new("."))
-        .join(lineage_filename);
+    let lineage_path = lineage_dir.join(lineage_filename);
     let lineage_file = std::fs::File::create(&lineage_path).map_err(MlPrepError::IoError)?;
     serde_json::to_writer_pretty(lineage_file, &lineage)
         .map_err(|e| MlPrepError::Unknown(e.into()))?;
@@ -285,4 +334,45 @@ mod tests {
         let non_existent_restricted = restricted_dir.join("output.parquet");
         assert!(context.validate_path(&non_existent_restricted).is_err());
     }
+
+    #[test]
+    fn test_execution_pipeline_from_str() {
+        let dir = tempdir().unwrap();
+        let input = dir.path().join("input.csv");
+        File::create(&input)
+            .unwrap()
+            .write_all(b"a,b\n1,2\n3,4")
+            .unwrap();
+        let output = dir.path().join("output.csv");
+
+        // JSON text goes through the same YAML loader as pipeline files
+        let config = serde_json::json!({
+            "inputs": [{"path": input}],
+            "steps": [{"type": "select", "columns": ["a"]}],
+            "outputs": [{"path": output}],
+        })
+        .to_string();
+        let security_config = SecurityConfig {
+            allowed_paths: None,
+            mask_columns: None,
+        };
+
+        super::execution_pipeline_from_str(
+            &config,
+            dir.path(),
+            uuid::Uuid::new_v4(),
+            security_config,
+            None,
+        )
+        .unwrap();
+
+        assert!(output.exists());
+        let lineage_written = std::fs::read_dir(dir.path()).unwrap().any(|e| {
+            e.unwrap()
+                .file_name()
+                .to_string_lossy()
+                .starts_with("lineage_")
+        });
+        assert!(lineage_written);
+    }
 }